@@ -7,24 +7,51 @@ HTML report with interactive charts for all three phases.
 """
 
 import argparse
+import fnmatch
+import gzip
 import json
 import os
 import re
 import sys
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 try:
-    import plotly.graph_objects as go
-    from plotly.subplots import make_subplots
+    import numpy as np
 except ImportError:
-    print("Error: plotly is required. Install with: pip install plotly")
+    print("Error: numpy is required. Install with: pip install numpy")
     sys.exit(1)
 
 
-@dataclass
+def _json_default(obj):
+    """Convert numpy arrays and scalars for the stdlib json fallback."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_json_default)
+
+
+# __slots__ dataclasses need Python 3.10+; older interpreters keep __dict__
+_DATACLASS_OPTIONS = dict(slots=True) if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FullTestResult:
     """Holds parsed fulltest results from a single test."""
     # Basic Info
@@ -48,8 +75,8 @@ class FullTestResult:
     p99_latency_ms: int = 0
     token_throughput: float = 0.0
     rps: float = 0.0
-    ttft_distribution: List[int] = field(default_factory=list)
-    latency_distribution: List[int] = field(default_factory=list)
+    ttft_distribution: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    latency_distribution: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
     
     # Phase 2: Function Call
     fc_supported: bool = False
@@ -73,29 +100,71 @@ class FullTestResult:
     summary_tokens_per_second: float = 0.0
 
 
-def find_fulltest_dirs(output_dir: str, pattern: Optional[str] = None) -> List[Path]:
-    """Find all directories containing fulltest results."""
+# Orderings accepted by find_fulltest_dirs / --sort
+SORT_KEYS = {
+    'name': lambda entry: entry.name,
+    'mtime': lambda entry: (entry.stat().st_mtime, entry.name),
+}
+
+
+def name_matcher(pattern: Optional[str]):
+    """Return a predicate for directory names: glob match if ``pattern`` has
+    wildcards, plain substring match otherwise, or accept-all if it is None."""
+    if pattern is None:
+        return lambda name: True
+    if any(c in pattern for c in '*?['):
+        return re.compile(fnmatch.translate(pattern)).match
+    return lambda name: pattern in name
+
+
+def find_fulltest_dirs(output_dir: str, pattern: Optional[str] = None, sort: str = 'name') -> List[Path]:
+    """Find all directories containing fulltest results, ordered by name or mtime."""
     output_path = Path(output_dir)
     if not output_path.exists():
         print(f"Error: Output directory '{output_dir}' does not exist")
         return []
     
-    results = []
-    for item in output_path.iterdir():
-        if not item.is_dir():
-            continue
-        
-        # Check if this looks like a fulltest result (has benchmark/summary.json)
-        summary_path = item / "benchmark" / "summary.json"
-        if summary_path.exists():
-            if pattern is None or pattern in item.name:
-                results.append(item)
-    
-    return sorted(results, key=lambda x: x.name)
+    matches = name_matcher(pattern)
+    entries = []
+    # scandir reports entry types from the directory listing itself, and
+    # the name filter runs first, so only candidate directories cost a stat
+    with os.scandir(output_path) as it:
+        for entry in it:
+            if not entry.is_dir() or not matches(entry.name):
+                continue
+            
+            # Check if this looks like a fulltest result (has benchmark/summary.json)
+            summary_path = os.path.join(entry.path, "benchmark", "summary.json")
+            if os.path.isfile(summary_path):
+                entries.append(entry)
+    
+    # DirEntry caches its stat result, so an mtime sort stats each hit once
+    entries.sort(key=SORT_KEYS[sort])
+    return [Path(entry.path) for entry in entries]
+
+
+# Section markers; checked on the raw bytes so reports without them are never decoded
+FC_SUPPORTED_MARKER = "✅ **支持 Function Call**"
+LC_SECTION_MARKER = "## Phase 3: 长上下文测试"
+FC_SUPPORTED_MARKER_BYTES = FC_SUPPORTED_MARKER.encode('utf-8')
+LC_SECTION_MARKER_BYTES = LC_SECTION_MARKER.encode('utf-8')
+
+# Patterns for full_test_report.md, compiled once for every result directory
+FC_FUNCTION_NAME_RE = re.compile(r'- 函数名: `([^`]+)`')
+FC_ARGUMENTS_RE = re.compile(r'- 参数: `([^`]+)`')
+FC_LATENCY_RE = re.compile(r'- 响应延迟: ([\d.]+) ms')
+# Table rows and the summary line of the Long Context section, matched in
+# one pass and told apart by match.lastgroup:
+#   | 1000 字符 | 700 | 123.45 | 456.78 | 12.34 | ✅ |
+#   **最大支持上下文**: 32000 字符 | **平均 TTFT**: 123.45 ms | **平均吞吐**: 12.34 tokens/s
+LC_LINE_RE = re.compile(
+    r'(?P<row>\|\s*(\d+)\s*字符\s*\|\s*(\d+)\s*\|\s*([\d.]+)\s*\|\s*([\d.]+)\s*\|\s*([\d.]+)\s*\|\s*([✅❌])\s*\|)'
+    r'|(?P<summary>\*\*最大支持上下文\*\*:\s*(\d+)\s*字符.*?\*\*平均 TTFT\*\*:\s*([\d.]+)\s*ms.*?\*\*平均吞吐\*\*:\s*([\d.]+)\s*tokens/s)'
+)
 
 
-def parse_function_call_from_md(md_path: Path) -> dict:
-    """Parse Function Call result from full_test_report.md."""
+def parse_function_call_from_md(content: str, md_path: Path) -> dict:
+    """Parse Function Call result from full_test_report.md content."""
     result = {
         "supported": False,
         "function_name": "",
@@ -103,28 +172,23 @@ def parse_function_call_from_md(md_path: Path) -> dict:
         "latency_ms": 0.0
     }
     
-    if not md_path.exists():
-        return result
-    
     try:
-        content = md_path.read_text(encoding='utf-8')
-        
         # Check if function call is supported
-        if "✅ **支持 Function Call**" in content:
+        if FC_SUPPORTED_MARKER in content:
             result["supported"] = True
             
             # Extract function name
-            fn_match = re.search(r'- 函数名: `([^`]+)`', content)
+            fn_match = FC_FUNCTION_NAME_RE.search(content)
             if fn_match:
                 result["function_name"] = fn_match.group(1)
             
             # Extract arguments
-            args_match = re.search(r'- 参数: `([^`]+)`', content)
+            args_match = FC_ARGUMENTS_RE.search(content)
             if args_match:
                 result["arguments"] = args_match.group(1)
             
             # Extract latency
-            latency_match = re.search(r'- 响应延迟: ([\d.]+) ms', content)
+            latency_match = FC_LATENCY_RE.search(content)
             if latency_match:
                 result["latency_ms"] = float(latency_match.group(1))
         
@@ -134,8 +198,8 @@ def parse_function_call_from_md(md_path: Path) -> dict:
     return result
 
 
-def parse_long_context_from_md(md_path: Path) -> dict:
-    """Parse Long Context test results from full_test_report.md."""
+def parse_long_context_from_md(content: str, md_path: Path) -> dict:
+    """Parse Long Context test results from full_test_report.md content."""
     result = {
         "max_supported": 0,
         "avg_ttft_ms": 0.0,
@@ -144,28 +208,30 @@ def parse_long_context_from_md(md_path: Path) -> dict:
         "results": []
     }
     
-    if not md_path.exists():
-        return result
-    
     try:
-        content = md_path.read_text(encoding='utf-8')
-        
-        # Find the Long Context section
-        lc_section = re.search(r'## Phase 3: 长上下文测试\s*(.*?)(?=## Phase|$)', content, re.DOTALL)
-        if not lc_section:
+        # Slice out the Long Context section, up to the next phase heading
+        start = content.find(LC_SECTION_MARKER)
+        if start < 0:
             return result
+        start += len(LC_SECTION_MARKER)
+        end = content.find('## Phase', start)
+        section_content = content[start:end] if end >= 0 else content[start:]
         
-        section_content = lc_section.group(1)
-        
-        # Parse table rows: | 1000 字符 | 700 | 123.45 | 456.78 | 12.34 | ✅ |
-        row_pattern = r'\|\s*(\d+)\s*字符\s*\|\s*(\d+)\s*\|\s*([\d.]+)\s*\|\s*([\d.]+)\s*\|\s*([\d.]+)\s*\|\s*([✅❌])\s*\|'
-        for match in re.finditer(row_pattern, section_content):
-            context_length = int(match.group(1))
-            input_tokens = int(match.group(2))
-            ttft_ms = float(match.group(3))
-            latency_ms = float(match.group(4))
-            throughput = float(match.group(5))
-            success = match.group(6) == '✅'
+        summary_match = None
+        latency_sum = 0.0
+        success_count = 0
+        for match in LC_LINE_RE.finditer(section_content):
+            if match.lastgroup == 'summary':
+                summary_match = match
+                continue
+            
+            # Table row
+            context_length = int(match.group(2))
+            input_tokens = int(match.group(3))
+            ttft_ms = float(match.group(4))
+            latency_ms = float(match.group(5))
+            throughput = float(match.group(6))
+            success = match.group(7) == '✅'
             
             result["results"].append({
                 "context_length": context_length,
@@ -178,18 +244,18 @@ def parse_long_context_from_md(md_path: Path) -> dict:
             
             if success:
                 result["max_supported"] = max(result["max_supported"], context_length)
+                latency_sum += latency_ms
+                success_count += 1
         
-        # Parse summary line: **最大支持上下文**: 32000 字符 | **平均 TTFT**: 123.45 ms | **平均吞吐**: 12.34 tokens/s
-        summary_match = re.search(r'\*\*最大支持上下文\*\*:\s*(\d+)\s*字符.*?\*\*平均 TTFT\*\*:\s*([\d.]+)\s*ms.*?\*\*平均吞吐\*\*:\s*([\d.]+)\s*tokens/s', section_content)
+        # The summary line overrides values derived from the rows
         if summary_match:
-            result["max_supported"] = int(summary_match.group(1))
-            result["avg_ttft_ms"] = float(summary_match.group(2))
-            result["avg_throughput"] = float(summary_match.group(3))
+            result["max_supported"] = int(summary_match.group(9))
+            result["avg_ttft_ms"] = float(summary_match.group(10))
+            result["avg_throughput"] = float(summary_match.group(11))
         
         # Calculate avg latency from results if not in summary
-        successful_results = [r for r in result["results"] if r["success"]]
-        if successful_results:
-            result["avg_latency_ms"] = sum(r["latency_ms"] for r in successful_results) / len(successful_results)
+        if success_count:
+            result["avg_latency_ms"] = latency_sum / success_count
         
     except Exception as e:
         print(f"Warning: Failed to parse long context from {md_path}: {e}")
@@ -197,7 +263,81 @@ def parse_long_context_from_md(md_path: Path) -> dict:
     return result
 
 
-def parse_fulltest_result(result_dir: Path) -> Optional[FullTestResult]:
+def parse_md(md_path: Path) -> Tuple[dict, dict]:
+    """Parse Function Call and Long Context results from a single read of full_test_report.md.
+    
+    The file is only decoded when one of the section markers is present in
+    the raw bytes; a parser whose marker is missing gets empty content.
+    """
+    fc_content = lc_content = ""
+    if md_path.exists():
+        try:
+            raw = md_path.read_bytes()
+            has_fc = FC_SUPPORTED_MARKER_BYTES in raw
+            has_lc = LC_SECTION_MARKER_BYTES in raw
+            if has_fc or has_lc:
+                # A stray invalid byte should not cost the whole section
+                content = raw.decode('utf-8', errors='replace')
+                fc_content = content if has_fc else ""
+                lc_content = content if has_lc else ""
+        except OSError as e:
+            print(f"Warning: Failed to read {md_path}: {e}")
+    
+    return parse_function_call_from_md(fc_content, md_path), parse_long_context_from_md(lc_content, md_path)
+
+
+# Values used for keys missing from benchmark/summary.json
+_SUMMARY_DEFAULTS = {
+    'model': 'Unknown',
+    'started_at': '',
+    'wall_time_ms': 0,
+    'total_requests': 0,
+    'success': 0,
+    'failure': 0,
+    'success_rate': 0,
+    'avg_ttft_ms': 0,
+    'p50_ttft_ms': 0,
+    'p95_ttft_ms': 0,
+    'p99_ttft_ms': 0,
+    'avg_latency_ms': 0,
+    'p50_latency_ms': 0,
+    'p95_latency_ms': 0,
+    'p99_latency_ms': 0,
+    'token_throughput': 0,
+    'rps': 0,
+    'ttft_distribution_ms': [],
+    'latency_distribution_ms': [],
+}
+
+# Values used for keys missing from summary/performance_metrics.json
+_METRICS_DEFAULTS = {
+    'total_chunks': 0,
+    'total_tokens': 0,
+    'total_prompt_tokens': 0,
+    'total_completion_tokens': 0,
+    'total_processing_time': 0,
+    'tokens_per_second': 0,
+}
+
+
+def with_defaults(defaults: dict, data: dict) -> dict:
+    """Fill keys that are missing or null in ``data`` from ``defaults``."""
+    return {**defaults, **{k: v for k, v in data.items() if v is not None}}
+
+
+# Distribution samples kept per result; box plots don't need every request
+DEFAULT_MAX_DIST_SAMPLES = 5000
+
+
+def downsample(samples: list, max_samples: int) -> list:
+    """Keep at most max_samples evenly strided samples (0 keeps all)."""
+    if max_samples <= 0 or len(samples) <= max_samples:
+        return samples
+    step = -(-len(samples) // max_samples)
+    return samples[::step]
+
+
+def parse_fulltest_result(result_dir: Path, max_dist_samples: int = DEFAULT_MAX_DIST_SAMPLES) -> Optional[FullTestResult]:
     """Parse a fulltest result directory."""
     # Parse benchmark/summary.json (Phase 1)
     summary_path = result_dir / "benchmark" / "summary.json"
@@ -206,57 +346,52 @@ def parse_fulltest_result(result_dir: Path) -> Optional[FullTestResult]:
         return None
     
     try:
-        with open(summary_path, 'r') as f:
-            bench_data = json.load(f)
+        bench_data = with_defaults(_SUMMARY_DEFAULTS, _json_loads(summary_path.read_bytes()))
         
         result = FullTestResult(
             name=result_dir.name,
-            model=bench_data.get('model', 'Unknown'),
-            started_at=bench_data.get('started_at', ''),
-            wall_time_ms=bench_data.get('wall_time_ms', 0),
-            total_requests=bench_data.get('total_requests', 0),
-            success=bench_data.get('success', 0),
-            failure=bench_data.get('failure', 0),
-            success_rate=bench_data.get('success_rate', 0),
-            avg_ttft_ms=bench_data.get('avg_ttft_ms', 0),
-            p50_ttft_ms=bench_data.get('p50_ttft_ms', 0),
-            p95_ttft_ms=bench_data.get('p95_ttft_ms', 0),
-            p99_ttft_ms=bench_data.get('p99_ttft_ms', 0),
-            avg_latency_ms=bench_data.get('avg_latency_ms', 0),
-            p50_latency_ms=bench_data.get('p50_latency_ms', 0),
-            p95_latency_ms=bench_data.get('p95_latency_ms', 0),
-            p99_latency_ms=bench_data.get('p99_latency_ms', 0),
-            token_throughput=bench_data.get('token_throughput', 0),
-            rps=bench_data.get('rps', 0),
-            ttft_distribution=bench_data.get('ttft_distribution_ms', []),
-            latency_distribution=bench_data.get('latency_distribution_ms', []),
+            model=bench_data['model'],
+            started_at=bench_data['started_at'],
+            wall_time_ms=bench_data['wall_time_ms'],
+            total_requests=bench_data['total_requests'],
+            success=bench_data['success'],
+            failure=bench_data['failure'],
+            success_rate=bench_data['success_rate'],
+            avg_ttft_ms=bench_data['avg_ttft_ms'],
+            p50_ttft_ms=bench_data['p50_ttft_ms'],
+            p95_ttft_ms=bench_data['p95_ttft_ms'],
+            p99_ttft_ms=bench_data['p99_ttft_ms'],
+            avg_latency_ms=bench_data['avg_latency_ms'],
+            p50_latency_ms=bench_data['p50_latency_ms'],
+            p95_latency_ms=bench_data['p95_latency_ms'],
+            p99_latency_ms=bench_data['p99_latency_ms'],
+            token_throughput=bench_data['token_throughput'],
+            rps=bench_data['rps'],
+            ttft_distribution=np.asarray(downsample(bench_data['ttft_distribution_ms'], max_dist_samples), dtype=np.int32),
+            latency_distribution=np.asarray(downsample(bench_data['latency_distribution_ms'], max_dist_samples), dtype=np.int32),
         )
         
         # Parse summary/performance_metrics.json (Phase 3)
         metrics_path = result_dir / "summary" / "performance_metrics.json"
         if metrics_path.exists():
-            with open(metrics_path, 'r') as f:
-                summary_data = json.load(f)
+            summary_data = with_defaults(_METRICS_DEFAULTS, _json_loads(metrics_path.read_bytes()))
             
-            result.summary_total_chunks = summary_data.get('total_chunks', 0)
-            result.summary_total_tokens = summary_data.get('total_tokens', 0)
-            result.summary_prompt_tokens = summary_data.get('total_prompt_tokens', 0)
-            result.summary_completion_tokens = summary_data.get('total_completion_tokens', 0)
+            result.summary_total_chunks = summary_data['total_chunks']
+            result.summary_total_tokens = summary_data['total_tokens']
+            result.summary_prompt_tokens = summary_data['total_prompt_tokens']
+            result.summary_completion_tokens = summary_data['total_completion_tokens']
             # Convert nanoseconds to seconds
-            processing_time_ns = summary_data.get('total_processing_time', 0)
-            result.summary_processing_time_sec = processing_time_ns / 1e9
-            result.summary_tokens_per_second = summary_data.get('tokens_per_second', 0)
+            result.summary_processing_time_sec = summary_data['total_processing_time'] / 1e9
+            result.summary_tokens_per_second = summary_data['tokens_per_second']
         
-        # Parse function call from full_test_report.md (Phase 2)
+        # Parse function call and long context results from full_test_report.md (Phase 2 & 3)
         md_path = result_dir / "full_test_report.md"
-        fc_data = parse_function_call_from_md(md_path)
+        fc_data, lc_data = parse_md(md_path)
         result.fc_supported = fc_data["supported"]
         result.fc_function_name = fc_data["function_name"]
         result.fc_arguments = fc_data["arguments"]
         result.fc_latency_ms = fc_data["latency_ms"]
         
-        # Parse long context results from full_test_report.md (Phase 3)
-        lc_data = parse_long_context_from_md(md_path)
         result.lc_max_supported = lc_data["max_supported"]
         result.lc_avg_ttft_ms = lc_data["avg_ttft_ms"]
         result.lc_avg_latency_ms = lc_data["avg_latency_ms"]
@@ -270,6 +405,128 @@ def parse_fulltest_result(result_dir: Path) -> Optional[FullTestResult]:
         return None
 
 
+CACHE_FILENAME = ".compare_cache.json"
+
+# Bump whenever parse_fulltest_result's output changes, so entries parsed
+# by an older version are treated as stale even if their sources are not
+CACHE_VERSION = 3
+
+# Files a result is parsed from, relative to its result directory
+SOURCE_FILES = (
+    Path("benchmark") / "summary.json",
+    Path("summary") / "performance_metrics.json",
+    Path("full_test_report.md"),
+)
+
+
+def get_source_mtimes(result_dir: Path) -> List[float]:
+    """Get modification times of a result's source files (0 if missing)."""
+    mtimes = []
+    for rel_path in SOURCE_FILES:
+        try:
+            mtimes.append((result_dir / rel_path).stat().st_mtime)
+        except OSError:
+            mtimes.append(0)
+    return mtimes
+
+
+# Array fields are stored as plain lists in the cache
+DISTRIBUTION_FIELDS = ('ttft_distribution', 'latency_distribution')
+
+
+def result_to_cache(result: FullTestResult) -> dict:
+    """Convert a result into a JSON-serializable cache entry."""
+    data = asdict(result)
+    for name in DISTRIBUTION_FIELDS:
+        data[name] = data[name].tolist()
+    return data
+
+
+def result_from_cache(data: dict) -> FullTestResult:
+    """Rebuild a result from a cache entry written by result_to_cache."""
+    data = dict(data)
+    for name in DISTRIBUTION_FIELDS:
+        data[name] = np.asarray(data.get(name, []), dtype=np.int32)
+    return FullTestResult(**data)
+
+
+def load_cache(cache_path: Path) -> dict:
+    """Load the parsed result cache, or an empty cache if missing or corrupt."""
+    try:
+        cache = _json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_cache(cache_path: Path, cache: dict) -> None:
+    """Write the parsed result cache back to disk."""
+    try:
+        cache_path.write_text(json.dumps(cache, ensure_ascii=False), encoding='utf-8')
+    except OSError as e:
+        print(f"Warning: Failed to write cache {cache_path}: {e}")
+
+
+def parse_fulltest_results(
+    result_dirs: List[Path],
+    cache_path: Optional[Path] = None,
+    max_dist_samples: int = DEFAULT_MAX_DIST_SAMPLES,
+    jobs: int = 1,
+) -> List[FullTestResult]:
+    """Parse all result directories, reusing cached results whose sources are unchanged.
+    
+    The cache maps directory names to {"version": CACHE_VERSION,
+    "mtimes": [...], "max_dist_samples": n, "result": {...}}; only
+    directories whose cache version, source file mtimes or sampling limit
+    changed are re-parsed. Stale directories are parsed in-process by
+    default; ``jobs > 1`` spreads them over up to ``jobs`` worker processes.
+    """
+    cache = load_cache(cache_path) if cache_path else {}
+    results: List[Optional[FullTestResult]] = [None] * len(result_dirs)
+    mtimes = [get_source_mtimes(d) for d in result_dirs]
+    
+    stale = []
+    for i, d in enumerate(result_dirs):
+        entry = cache.get(d.name)
+        if (isinstance(entry, dict) and entry.get("version") == CACHE_VERSION
+                and entry.get("mtimes") == mtimes[i]
+                and entry.get("max_dist_samples") == max_dist_samples):
+            try:
+                results[i] = result_from_cache(entry["result"])
+                continue
+            except (KeyError, TypeError):
+                pass  # Written by an older version with different fields
+        stale.append(i)
+    
+    if stale:
+        parse = partial(parse_fulltest_result, max_dist_samples=max_dist_samples)
+        stale_dirs = [result_dirs[i] for i in stale]
+        workers = min(jobs, len(stale))
+        if workers > 1:
+            # JSON decoding and regex scanning are CPU bound, so use
+            # processes rather than threads to get past the GIL
+            chunksize = max(1, len(stale) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = list(executor.map(parse, stale_dirs, chunksize=chunksize))
+        else:
+            parsed = [parse(d) for d in stale_dirs]
+        
+        for i, result in zip(stale, parsed):
+            results[i] = result
+            if result:
+                cache[result_dirs[i].name] = {
+                    "version": CACHE_VERSION,
+                    "mtimes": mtimes[i],
+                    "max_dist_samples": max_dist_samples,
+                    "result": result_to_cache(result),
+                }
+        
+        if cache_path:
+            save_cache(cache_path, cache)
+    
+    return [r for r in results if r]
+
+
 # Premium color palette
 COLORS = {
     'blue': '#6366f1',
@@ -282,175 +539,236 @@ COLORS = {
     'indigo': '#4f46e5',
 }
 
+# The plotly_dark template itself is shared by all charts in the page
+# script (see render_charts_script) rather than copied into each layout
 DARK_LAYOUT = dict(
-    template='plotly_dark',
     paper_bgcolor='rgba(0,0,0,0)',
     plot_bgcolor='rgba(0,0,0,0)',
     font=dict(family='Plus Jakarta Sans, sans-serif', color='#f0f0f5'),
-    title_font=dict(size=18, color='#f0f0f5'),
     legend=dict(bgcolor='rgba(0,0,0,0)'),
 )
 
-def create_ttft_chart(results: List[FullTestResult]) -> str:
+TITLE_FONT = dict(size=18, color='#f0f0f5')
+
+
+def dark_layout(title: str, **kwargs) -> dict:
+    """Build a figure layout with the shared dark styling and a title."""
+    return dict(DARK_LAYOUT, title=dict(text=title, font=TITLE_FONT), **kwargs)
+
+
+def subplot_grid(titles: List[str]) -> dict:
+    """Build the axes and title annotations of a single-row subplot grid.
+    
+    Produces the same layout as plotly's make_subplots(rows=1, cols=len(titles)),
+    without constructing and validating a go.Figure.
+    """
+    cols = len(titles)
+    spacing = 0.2 / cols
+    width = (1 - spacing * (cols - 1)) / cols
+    
+    layout = {}
+    annotations = []
+    for i, title in enumerate(titles):
+        start = i * (width + spacing)
+        suffix = str(i + 1) if i else ''
+        layout[f'xaxis{suffix}'] = dict(anchor=f'y{suffix}', domain=[start, start + width])
+        layout[f'yaxis{suffix}'] = dict(anchor=f'x{suffix}', domain=[0.0, 1.0])
+        annotations.append(dict(
+            text=title,
+            x=start + width / 2, y=1.0,
+            xref='paper', yref='paper',
+            xanchor='center', yanchor='bottom',
+            showarrow=False,
+            font=dict(size=16)
+        ))
+    layout['annotations'] = annotations
+    return layout
+
+
+CHART_CONFIG = dict(responsive=True)
+
+# Same escapes plotly applies so figure JSON can never close the <script> tag
+SCRIPT_JSON_ESCAPES = str.maketrans({
+    '<': '\\u003c',
+    '>': '\\u003e',
+    '/': '\\u002f',
+    '\u2028': '\\u2028',
+    '\u2029': '\\u2029',
+})
+
+_PLOTLY_IO = None
+
+
+def _get_plotly():
+    """Import plotly.io on first use; only chart generation needs it."""
+    global _PLOTLY_IO
+    if _PLOTLY_IO is None:
+        try:
+            import plotly.io as pio
+        except ImportError:
+            print("Error: plotly is required. Install with: pip install plotly")
+            sys.exit(1)
+        _PLOTLY_IO = pio
+    return _PLOTLY_IO
+
+
+@lru_cache(maxsize=None)
+def dark_template() -> dict:
+    """Return the plotly_dark template as a plain dict."""
+    return _get_plotly().templates['plotly_dark'].to_plotly_json()
+
+
+@lru_cache(maxsize=None)
+def dark_template_json() -> str:
+    """Serialize the dark template once; it is emitted once per report."""
+    return _json_dumps(dark_template()).translate(SCRIPT_JSON_ESCAPES)
+
+# Applies the shared template to a figure before drawing it
+DRAW_CHART_JS = """function drawChart(id, fig) {
+    fig.layout.template = darkTemplate;
+    Plotly.newPlot(id, fig);
+}"""
+
+
+def chart_div(div_id: str, fig: Optional[dict]) -> str:
+    """Render the placeholder <div> a chart is drawn into."""
+    if not fig:
+        return ""
+    height = fig['layout'].get('height')
+    style = f"height:{height}px; width:100%;" if height else "width:100%;"
+    return f'<div id="{div_id}" class="plotly-graph-div" style="{style}"></div>'
+
+
+def render_charts_script(charts: dict) -> str:
+    """Render one <script> block that draws every chart into its <div>.
+    
+    Figures are plain trace/layout dicts built by hand, so they are dumped
+    straight to JSON without going through Plotly's validation or encoder.
+    The dark template is defined once and attached to each layout in JS.
+    """
+    calls = [f"const darkTemplate = {dark_template_json()};", DRAW_CHART_JS]
+    for div_id, fig in charts.items():
+        if fig:
+            fig_json = _json_dumps(dict(fig, config=CHART_CONFIG)).translate(SCRIPT_JSON_ESCAPES)
+            calls.append(f'drawChart("{div_id}", {fig_json});')
+    return "<script>\n" + "\n".join(calls) + "\n</script>"
+
+
+# Scalar metric fields exposed as per-field arrays for the chart builders
+COLUMN_FIELDS = tuple(f.name for f in fields(FullTestResult) if f.type in (int, float, bool))
+
+
+def build_columns(results: List[FullTestResult]) -> dict:
+    """Collect each scalar metric into one numpy array across all results."""
+    return {
+        name: np.array([getattr(r, name) for r in results])
+        for name in COLUMN_FIELDS
+    }
+
+
+def create_ttft_chart(columns: dict, names: List[str]) -> dict:
     """Create TTFT comparison chart."""
-    names = [r.name for r in results]
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        name='Avg TTFT',
-        x=names,
-        y=[r.avg_ttft_ms for r in results],
-        marker_color=COLORS['blue']
-    ))
-    fig.add_trace(go.Bar(
-        name='P50 TTFT',
-        x=names,
-        y=[r.p50_ttft_ms for r in results],
-        marker_color=COLORS['green']
-    ))
-    fig.add_trace(go.Bar(
-        name='P95 TTFT',
-        x=names,
-        y=[r.p95_ttft_ms for r in results],
-        marker_color=COLORS['orange']
-    ))
-    fig.add_trace(go.Bar(
-        name='P99 TTFT',
-        x=names,
-        y=[r.p99_ttft_ms for r in results],
-        marker_color=COLORS['red']
-    ))
-    
-    fig.update_layout(
-        title='Time To First Token (TTFT) 对比',
-        xaxis_title='测试名称',
-        yaxis_title='时间 (ms)',
+    data = [
+        dict(type='bar', name='Avg TTFT', x=names,
+             y=columns['avg_ttft_ms'], marker=dict(color=COLORS['blue'])),
+        dict(type='bar', name='P50 TTFT', x=names,
+             y=columns['p50_ttft_ms'], marker=dict(color=COLORS['green'])),
+        dict(type='bar', name='P95 TTFT', x=names,
+             y=columns['p95_ttft_ms'], marker=dict(color=COLORS['orange'])),
+        dict(type='bar', name='P99 TTFT', x=names,
+             y=columns['p99_ttft_ms'], marker=dict(color=COLORS['red'])),
+    ]
+    
+    layout = dark_layout(
+        'Time To First Token (TTFT) 对比',
+        xaxis=dict(title=dict(text='测试名称')),
+        yaxis=dict(title=dict(text='时间 (ms)')),
         barmode='group',
         height=500,
-        **DARK_LAYOUT
     )
     
-    return fig.to_html(full_html=False, include_plotlyjs=False)
+    return dict(data=data, layout=layout)
 
 
-def create_latency_chart(results: List[FullTestResult]) -> str:
+def create_latency_chart(columns: dict, names: List[str]) -> dict:
     """Create Latency comparison chart."""
-    names = [r.name for r in results]
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        name='Avg Latency',
-        x=names,
-        y=[r.avg_latency_ms for r in results],
-        marker_color=COLORS['blue']
-    ))
-    fig.add_trace(go.Bar(
-        name='P50 Latency',
-        x=names,
-        y=[r.p50_latency_ms for r in results],
-        marker_color=COLORS['green']
-    ))
-    fig.add_trace(go.Bar(
-        name='P95 Latency',
-        x=names,
-        y=[r.p95_latency_ms for r in results],
-        marker_color=COLORS['orange']
-    ))
-    fig.add_trace(go.Bar(
-        name='P99 Latency',
-        x=names,
-        y=[r.p99_latency_ms for r in results],
-        marker_color=COLORS['red']
-    ))
-    
-    fig.update_layout(
-        title='总延迟 (Latency) 对比',
-        xaxis_title='测试名称',
-        yaxis_title='时间 (ms)',
+    data = [
+        dict(type='bar', name='Avg Latency', x=names,
+             y=columns['avg_latency_ms'], marker=dict(color=COLORS['blue'])),
+        dict(type='bar', name='P50 Latency', x=names,
+             y=columns['p50_latency_ms'], marker=dict(color=COLORS['green'])),
+        dict(type='bar', name='P95 Latency', x=names,
+             y=columns['p95_latency_ms'], marker=dict(color=COLORS['orange'])),
+        dict(type='bar', name='P99 Latency', x=names,
+             y=columns['p99_latency_ms'], marker=dict(color=COLORS['red'])),
+    ]
+    
+    layout = dark_layout(
+        '总延迟 (Latency) 对比',
+        xaxis=dict(title=dict(text='测试名称')),
+        yaxis=dict(title=dict(text='时间 (ms)')),
         barmode='group',
         height=500,
-        **DARK_LAYOUT
     )
     
-    return fig.to_html(full_html=False, include_plotlyjs=False)
+    return dict(data=data, layout=layout)
 
 
-def create_throughput_chart(results: List[FullTestResult]) -> str:
+def create_throughput_chart(columns: dict, names: List[str]) -> dict:
     """Create throughput comparison chart."""
-    names = [r.name for r in results]
-    
-    fig = make_subplots(
-        rows=1, cols=2,
-        subplot_titles=('Token 吞吐量 (tokens/s)', 'RPS (请求/秒)')
-    )
-    
-    fig.add_trace(
-        go.Bar(
-            x=names,
-            y=[r.token_throughput for r in results],
-            marker_color=COLORS['purple'],
-            name='Token Throughput'
-        ),
-        row=1, col=1
-    )
-    
-    fig.add_trace(
-        go.Bar(
-            x=names,
-            y=[r.rps for r in results],
-            marker_color=COLORS['cyan'],
-            name='RPS'
-        ),
-        row=1, col=2
-    )
-    
-    fig.update_layout(
-        title='吞吐量对比',
+    data = [
+        dict(type='bar', name='Token Throughput', x=names,
+             y=columns['token_throughput'],
+             marker=dict(color=COLORS['purple']), xaxis='x', yaxis='y'),
+        dict(type='bar', name='RPS', x=names,
+             y=columns['rps'],
+             marker=dict(color=COLORS['cyan']), xaxis='x2', yaxis='y2'),
+    ]
+    
+    layout = dark_layout(
+        '吞吐量对比',
         height=400,
         showlegend=False,
-        **DARK_LAYOUT
+        **subplot_grid(['Token 吞吐量 (tokens/s)', 'RPS (请求/秒)'])
     )
     
-    return fig.to_html(full_html=False, include_plotlyjs=False)
+    return dict(data=data, layout=layout)
 
 
-def create_radar_chart(results: List[FullTestResult]) -> str:
+# Radar axes: TTFT, Latency, Throughput, RPS, Success rate, Summary Token/s
+RADAR_FIELDS = ('avg_ttft_ms', 'avg_latency_ms', 'token_throughput', 'rps',
+                'success_rate', 'summary_tokens_per_second')
+
+
+def create_radar_chart(columns: dict, names: List[str]) -> Optional[dict]:
     """Create radar chart for multi-dimensional comparison."""
-    if not results:
-        return ""
+    if not names:
+        return None
     
-    # Normalize values for radar chart (higher is better for all)
-    max_ttft = max(r.avg_ttft_ms for r in results) or 1
-    max_latency = max(r.avg_latency_ms for r in results) or 1
-    max_throughput = max(r.token_throughput for r in results) or 1
-    max_rps = max(r.rps for r in results) or 1
-    max_summary_tps = max(r.summary_tokens_per_second for r in results) or 1
+    values = np.column_stack([
+        columns[name].astype(np.float64) for name in RADAR_FIELDS
+    ])
     
-    fig = go.Figure()
+    # Normalize values for radar chart (higher is better for all)
+    maxes = values.max(axis=0)
+    # Columns that are zero for every result score as 0 rather than NaN
+    ratios = np.divide(values, maxes, out=np.zeros_like(values), where=maxes > 0)
+    scores = ratios * 100
+    # Invert TTFT and Latency so higher is better
+    scores[:, :2] = (1 - ratios[:, :2]) * 100
+    # Success rate is already a ratio
+    scores[:, 4] = values[:, 4] * 100
     
     categories = ['响应速度<br>(1/TTFT)', '生成速度<br>(1/Latency)', 
                   '吞吐量', 'RPS', '成功率', '会议纪要<br>Token/s']
     
-    for r in results:
-        # Invert TTFT and Latency so higher is better
-        ttft_score = (1 - r.avg_ttft_ms / max_ttft) * 100 if max_ttft > 0 else 0
-        latency_score = (1 - r.avg_latency_ms / max_latency) * 100 if max_latency > 0 else 0
-        throughput_score = (r.token_throughput / max_throughput) * 100 if max_throughput > 0 else 0
-        rps_score = (r.rps / max_rps) * 100 if max_rps > 0 else 0
-        success_score = r.success_rate * 100
-        summary_score = (r.summary_tokens_per_second / max_summary_tps) * 100 if max_summary_tps > 0 else 0
-        
-        fig.add_trace(go.Scatterpolar(
-            r=[ttft_score, latency_score, throughput_score, rps_score, success_score, summary_score],
-            theta=categories,
-            fill='toself',
-            name=r.name
-        ))
+    data = [
+        dict(type='scatterpolar', r=row, theta=categories, fill='toself', name=name)
+        for name, row in zip(names, scores.tolist())
+    ]
     
-    fig.update_layout(
-        title='综合性能雷达图',
+    layout = dark_layout(
+        '综合性能雷达图',
         polar=dict(
             radialaxis=dict(
                 visible=True,
@@ -461,165 +779,145 @@ def create_radar_chart(results: List[FullTestResult]) -> str:
             angularaxis=dict(gridcolor='rgba(255,255,255,0.1)')
         ),
         height=500,
-        **DARK_LAYOUT
     )
     
-    return fig.to_html(full_html=False, include_plotlyjs=False)
+    return dict(data=data, layout=layout)
 
 
-def create_ttft_distribution_chart(results: List[FullTestResult]) -> str:
-    """Create TTFT distribution box plot."""
-    fig = go.Figure()
-    
-    for r in results:
-        if r.ttft_distribution:
-            fig.add_trace(go.Box(
-                y=r.ttft_distribution,
-                name=r.name,
-                boxpoints='outliers'
-            ))
-    
-    fig.update_layout(
-        title='TTFT 分布对比 (箱线图)',
-        yaxis_title='TTFT (ms)',
-        height=400,
-        **DARK_LAYOUT
-    )
-    
-    return fig.to_html(full_html=False, include_plotlyjs=False)
+# Outlier markers drawn per box; long-tailed runs can have thousands
+MAX_BOX_OUTLIERS = 200
 
 
-def create_latency_distribution_chart(results: List[FullTestResult]) -> str:
-    """Create Latency distribution box plot."""
-    fig = go.Figure()
-    
-    for r in results:
-        if r.latency_distribution:
-            fig.add_trace(go.Box(
-                y=r.latency_distribution,
-                name=r.name,
-                boxpoints='outliers'
-            ))
-    
-    fig.update_layout(
-        title='Latency 分布对比 (箱线图)',
-        yaxis_title='Latency (ms)',
-        height=400,
-        **DARK_LAYOUT
+def box_traces(name: str, samples: np.ndarray, color: str,
+               axis: str = '', showlegend: bool = True) -> List[dict]:
+    """Build a precomputed box trace plus a marker trace for its outliers.
+    
+    Statistics follow Plotly's defaults (its 'linear' quartiles, NumPy's
+    'hazen' method, and whiskers at the furthest samples within 1.5 IQR),
+    so the browser gets a few numbers and at most ``MAX_BOX_OUTLIERS``
+    outliers instead of the whole distribution. ``axis`` is the subplot
+    suffix ('' for x/y, '2' for x2/y2).
+    """
+    q1, median, q3 = np.percentile(samples, [25, 50, 75], method='hazen').tolist()
+    iqr = q3 - q1
+    inside = samples[(samples >= q1 - 1.5 * iqr) & (samples <= q3 + 1.5 * iqr)]
+    lowerfence, upperfence = inside.min().item(), inside.max().item()
+    outliers = samples[(samples < lowerfence) | (samples > upperfence)]
+    if outliers.size > MAX_BOX_OUTLIERS:
+        # Evenly spaced over the sorted outliers, keeping both extremes
+        keep = np.linspace(0, outliers.size - 1, MAX_BOX_OUTLIERS).astype(np.intp)
+        outliers = np.sort(outliers)[keep]
+    
+    traces = [dict(
+        type='box', x=[name], name=name, legendgroup=name, showlegend=showlegend,
+        q1=[q1], median=[median], q3=[q3],
+        lowerfence=[lowerfence], upperfence=[upperfence],
+        marker=dict(color=color), xaxis=f'x{axis}', yaxis=f'y{axis}',
+    )]
+    if outliers.size:
+        traces.append(dict(
+            type='scatter', x=[name] * outliers.size, y=outliers,
+            mode='markers', name=name, legendgroup=name, showlegend=False,
+            marker=dict(color=color, size=6), hoverinfo='y',
+            xaxis=f'x{axis}', yaxis=f'y{axis}',
+        ))
+    return traces
+
+
+def create_distribution_chart(results: List[FullTestResult]) -> dict:
+    """Create TTFT and Latency distribution box plots side by side."""
+    data = []
+    # Trace colors of the dark template, in the order Plotly assigns them
+    colors = dark_template()['layout']['colorway']
+    for i, r in enumerate(results):
+        color = colors[i % len(colors)]
+        if r.ttft_distribution.size:
+            data.extend(box_traces(r.name, r.ttft_distribution, color))
+        if r.latency_distribution.size:
+            # One legend entry per result; the shared legendgroup toggles both boxes
+            data.extend(box_traces(r.name, r.latency_distribution, color, axis='2',
+                                   showlegend=not r.ttft_distribution.size))
+    
+    grid = subplot_grid(['TTFT 分布', 'Latency 分布'])
+    grid['yaxis']['title'] = dict(text='TTFT (ms)')
+    grid['yaxis2']['title'] = dict(text='Latency (ms)')
+    layout = dark_layout(
+        '延迟分布对比 (箱线图)',
+        height=450,
+        **grid
     )
     
-    return fig.to_html(full_html=False, include_plotlyjs=False)
+    return dict(data=data, layout=layout)
 
 
-def create_summary_chart(results: List[FullTestResult]) -> str:
+def create_summary_chart(columns: dict, names: List[str]) -> dict:
     """Create meeting summary performance comparison chart."""
-    names = [r.name for r in results]
-    
-    fig = make_subplots(
-        rows=1, cols=3,
-        subplot_titles=('Token/s', '总 Tokens', '处理时间 (秒)')
-    )
-    
-    fig.add_trace(
-        go.Bar(
-            x=names,
-            y=[r.summary_tokens_per_second for r in results],
-            marker_color=COLORS['red'],
-            name='Token/s'
-        ),
-        row=1, col=1
-    )
-    
-    fig.add_trace(
-        go.Bar(
-            x=names,
-            y=[r.summary_total_tokens for r in results],
-            marker_color=COLORS['blue'],
-            name='Total Tokens'
-        ),
-        row=1, col=2
-    )
-    
-    fig.add_trace(
-        go.Bar(
-            x=names,
-            y=[r.summary_processing_time_sec for r in results],
-            marker_color=COLORS['green'],
-            name='Processing Time'
-        ),
-        row=1, col=3
-    )
-    
-    fig.update_layout(
-        title='会议纪要性能对比',
+    data = [
+        dict(type='bar', name='Token/s', x=names,
+             y=columns['summary_tokens_per_second'],
+             marker=dict(color=COLORS['red']), xaxis='x', yaxis='y'),
+        dict(type='bar', name='Total Tokens', x=names,
+             y=columns['summary_total_tokens'],
+             marker=dict(color=COLORS['blue']), xaxis='x2', yaxis='y2'),
+        dict(type='bar', name='Processing Time', x=names,
+             y=columns['summary_processing_time_sec'],
+             marker=dict(color=COLORS['green']), xaxis='x3', yaxis='y3'),
+    ]
+    
+    layout = dark_layout(
+        '会议纪要性能对比',
         height=400,
         showlegend=False,
-        **DARK_LAYOUT
+        **subplot_grid(['Token/s', '总 Tokens', '处理时间 (秒)'])
     )
     
-    return fig.to_html(full_html=False, include_plotlyjs=False)
+    return dict(data=data, layout=layout)
 
 
-def create_long_context_chart(results: List[FullTestResult]) -> str:
+def create_long_context_chart(columns: dict, names: List[str]) -> dict:
     """Create long context test comparison chart."""
-    fig = make_subplots(
-        rows=1, cols=3,
-        subplot_titles=('最大支持上下文 (字符)', '平均 TTFT (ms)', '平均吞吐 (tokens/s)')
-    )
-    
-    names = [r.name for r in results]
-    
-    fig.add_trace(
-        go.Bar(
-            x=names,
-            y=[r.lc_max_supported for r in results],
-            marker_color=COLORS['purple'],
-            name='Max Context'
-        ),
-        row=1, col=1
-    )
-    
-    fig.add_trace(
-        go.Bar(
-            x=names,
-            y=[r.lc_avg_ttft_ms for r in results],
-            marker_color=COLORS['blue'],
-            name='Avg TTFT'
-        ),
-        row=1, col=2
-    )
-    
-    fig.add_trace(
-        go.Bar(
-            x=names,
-            y=[r.lc_avg_throughput for r in results],
-            marker_color=COLORS['green'],
-            name='Avg Throughput'
-        ),
-        row=1, col=3
-    )
-    
-    fig.update_layout(
-        title='长上下文测试对比',
+    data = [
+        dict(type='bar', name='Max Context', x=names,
+             y=columns['lc_max_supported'],
+             marker=dict(color=COLORS['purple']), xaxis='x', yaxis='y'),
+        dict(type='bar', name='Avg TTFT', x=names,
+             y=columns['lc_avg_ttft_ms'],
+             marker=dict(color=COLORS['blue']), xaxis='x2', yaxis='y2'),
+        dict(type='bar', name='Avg Throughput', x=names,
+             y=columns['lc_avg_throughput'],
+             marker=dict(color=COLORS['green']), xaxis='x3', yaxis='y3'),
+    ]
+    
+    layout = dark_layout(
+        '长上下文测试对比',
         height=400,
         showlegend=False,
-        **DARK_LAYOUT
+        **subplot_grid(['最大支持上下文 (字符)', '平均 TTFT (ms)', '平均吞吐 (tokens/s)'])
     )
     
-    return fig.to_html(full_html=False, include_plotlyjs=False)
+    return dict(data=data, layout=layout)
+
+
+# Line charts with more points than this are drawn with WebGL instead of SVG;
+# smaller ones stay on SVG, where each chart does not hold a GL context
+WEBGL_MIN_POINTS = 1000
 
 
-def create_long_context_detail_chart(results: List[FullTestResult]) -> str:
+def create_long_context_detail_chart(results: List[FullTestResult]) -> dict:
     """Create detailed long context performance chart showing TTFT vs context length."""
-    fig = go.Figure()
+    data = []
     
     for r in results:
         if r.lc_results:
-            x_vals = [res["context_length"] / 1000 for res in r.lc_results if res["success"]]  # Convert to K
-            y_ttft = [res["ttft_ms"] for res in r.lc_results if res["success"]]
+            x_vals, y_ttft = [], []
+            for res in r.lc_results:
+                if res["success"]:
+                    x_vals.append(res["context_length"] / 1000)  # Convert to K
+                    y_ttft.append(res["ttft_ms"])
             
-            if x_vals and y_ttft:
-                fig.add_trace(go.Scatter(
+            if x_vals:
+                data.append(dict(
+                    type='scatter',
                     x=x_vals,
                     y=y_ttft,
                     mode='lines+markers',
@@ -628,41 +926,87 @@ def create_long_context_detail_chart(results: List[FullTestResult]) -> str:
                     line=dict(width=3)
                 ))
     
-    fig.update_layout(
-        title='长上下文 TTFT 曲线对比',
-        xaxis_title='上下文长度 (K字符)',
-        yaxis_title='TTFT (ms)',
+    if sum(len(trace['x']) for trace in data) > WEBGL_MIN_POINTS:
+        for trace in data:
+            trace['type'] = 'scattergl'
+    
+    layout = dark_layout(
+        '长上下文 TTFT 曲线对比',
+        xaxis=dict(title=dict(text='上下文长度 (K字符)')),
+        yaxis=dict(title=dict(text='TTFT (ms)')),
         height=450,
-        **DARK_LAYOUT
     )
     
-    return fig.to_html(full_html=False, include_plotlyjs=False)
+    return dict(data=data, layout=layout)
 
 
-def generate_html_report(results: List[FullTestResult], output_path: str) -> None:
-    """Generate the complete HTML comparison report with premium styling."""
-    
-    # Update chart templates to use dark theme
-    import plotly.io as pio
-    pio.templates.default = "plotly_dark"
-        # Generate all charts
-    ttft_chart = create_ttft_chart(results)
-    latency_chart = create_latency_chart(results)
-    throughput_chart = create_throughput_chart(results)
-    radar_chart = create_radar_chart(results)
-    ttft_dist_chart = create_ttft_distribution_chart(results)
-    latency_dist_chart = create_latency_distribution_chart(results)
-    long_context_chart = create_long_context_chart(results)
-    long_context_detail_chart = create_long_context_detail_chart(results)
-    summary_chart = create_summary_chart(results)
-    
-    # Generate Phase 1 summary table
-    phase1_rows = ""
+# Page colors, written into the CSS as literal values by the template
+# rather than resolved through CSS custom properties by the browser
+PALETTE = {
+    'bg_primary': '#0a0a0f',
+    'bg_secondary': '#12121a',
+    'bg_card': 'rgba(255, 255, 255, 0.03)',
+    'border': 'rgba(255, 255, 255, 0.08)',
+    'text_primary': '#f0f0f5',
+    'text_secondary': '#8b8b9e',
+    'accent_blue': '#6366f1',
+    'accent_purple': '#8b5cf6',
+    'accent_pink': '#ec4899',
+    'accent_green': '#10b981',
+    'accent_red': '#f43f5e',
+    'accent_orange': '#f59e0b',
+}
+
+
+# Report page template (templates/report.html.jinja); rows, chart divs and
+# the chart script are pre-rendered HTML, so autoescape stays off. Compiled
+# templates are kept in Jinja's per-user bytecode cache between runs.
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+REPORT_TEMPLATE_NAME = "report.html.jinja"
+
+
+@lru_cache(maxsize=None)
+def report_template():
+    """Import jinja2 and load the report template on first use."""
+    try:
+        from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+    except ImportError:
+        print("Error: jinja2 is required. Install with: pip install jinja2")
+        sys.exit(1)
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        bytecode_cache=FileSystemBytecodeCache(),
+        autoescape=False,
+        keep_trailing_newline=True,
+        # Loaded once per process; the bytecode cache is keyed by source
+        # checksum, so template edits are still picked up on the next run
+        auto_reload=False,
+    )
+    return env.get_template(REPORT_TEMPLATE_NAME, globals={'palette': PALETTE})
+
+
+# Escapes for text cells taken from result directories and reports
+HTML_ESCAPES = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;',
+})
+
+
+def escape_html(text: str) -> str:
+    """Escape text for an HTML table cell in a single translate pass."""
+    return text.translate(HTML_ESCAPES)
+
+
+def iter_phase1_rows(results: List[FullTestResult]) -> Iterator[str]:
+    """Yield the Phase 1 performance table rows."""
     for r in results:
-        phase1_rows += f"""
+        yield f"""
         <tr>
-            <td>{r.name}</td>
-            <td>{r.model}</td>
+            <td>{escape_html(r.name)}</td>
+            <td>{escape_html(r.model)}</td>
             <td>{r.avg_ttft_ms:.2f}</td>
             <td>{r.p99_ttft_ms}</td>
             <td>{r.avg_latency_ms:.2f}</td>
@@ -672,41 +1016,44 @@ def generate_html_report(results: List[FullTestResult], output_path: str) -> Non
             <td>{r.success_rate*100:.1f}%</td>
         </tr>
         """
-    
-    # Generate Phase 2 Function Call table
-    fc_rows = ""
+
+
+def iter_function_call_rows(results: List[FullTestResult]) -> Iterator[str]:
+    """Yield the Phase 2 Function Call table rows."""
     for r in results:
         status = "✅ 支持" if r.fc_supported else "❌ 不支持"
         status_class = "success" if r.fc_supported else "error"
-        fc_rows += f"""
+        yield f"""
         <tr>
-            <td>{r.name}</td>
+            <td>{escape_html(r.name)}</td>
             <td class="{status_class}">{status}</td>
-            <td>{r.fc_function_name or '-'}</td>
-            <td><code>{r.fc_arguments or '-'}</code></td>
+            <td>{escape_html(r.fc_function_name or '-')}</td>
+            <td><code>{escape_html(r.fc_arguments or '-')}</code></td>
             <td>{f'{r.fc_latency_ms:.2f}' if r.fc_latency_ms else '-'}</td>
         </tr>
         """
-    
-    # Generate Phase 3 Long Context table
-    lc_rows = ""
+
+
+def iter_long_context_rows(results: List[FullTestResult]) -> Iterator[str]:
+    """Yield the Phase 3 long context table rows."""
     for r in results:
-        lc_rows += f"""
+        yield f"""
         <tr>
-            <td>{r.name}</td>
+            <td>{escape_html(r.name)}</td>
             <td>{r.lc_max_supported:,} 字符</td>
             <td>{r.lc_avg_ttft_ms:.2f}</td>
             <td>{r.lc_avg_latency_ms:.2f}</td>
             <td>{r.lc_avg_throughput:.2f}</td>
         </tr>
         """
-    
-    # Generate Phase 4 Summary table
-    summary_rows = ""
+
+
+def iter_summary_rows(results: List[FullTestResult]) -> Iterator[str]:
+    """Yield the Phase 4 meeting summary table rows."""
     for r in results:
-        summary_rows += f"""
+        yield f"""
         <tr>
-            <td>{r.name}</td>
+            <td>{escape_html(r.name)}</td>
             <td>{r.summary_total_chunks}</td>
             <td>{r.summary_prompt_tokens:,}</td>
             <td>{r.summary_completion_tokens:,}</td>
@@ -715,404 +1062,72 @@ def generate_html_report(results: List[FullTestResult], output_path: str) -> Non
             <td>{r.summary_tokens_per_second:.2f}</td>
         </tr>
         """
+
+
+# The template stream emits many small chunks; buffer them into few large writes
+REPORT_WRITE_BUFFER = 1 << 20
+
+
+def open_report(output_path: str):
+    """Open the report for writing, gzip-compressed when the path ends in .gz.
+
+    newline='' keeps the page's LF line endings on every platform.
+    """
+    if output_path.endswith('.gz'):
+        return gzip.open(output_path, 'wt', encoding='utf-8', newline='', compresslevel=6)
+    return open(output_path, 'w', encoding='utf-8', newline='', buffering=REPORT_WRITE_BUFFER)
+
+
+def generate_html_report(results: List[FullTestResult], output_path: str) -> None:
+    """Generate the complete HTML comparison report with premium styling."""
     
-    html_content = f"""<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>LLM FullTest 对比报告</title>
-    <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600&family=Plus+Jakarta+Sans:wght@400;500;600;700&display=swap');
-        
-        :root {{
-            --color-bg-primary: #0a0a0f;
-            --color-bg-secondary: #12121a;
-            --color-bg-card: rgba(255, 255, 255, 0.03);
-            --color-border: rgba(255, 255, 255, 0.08);
-            --color-text-primary: #f0f0f5;
-            --color-text-secondary: #8b8b9e;
-            --color-accent-blue: #6366f1;
-            --color-accent-purple: #8b5cf6;
-            --color-accent-pink: #ec4899;
-            --color-accent-green: #10b981;
-            --color-accent-red: #f43f5e;
-            --color-accent-orange: #f59e0b;
-            --font-sans: 'Plus Jakarta Sans', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            --font-mono: 'JetBrains Mono', 'SF Mono', 'Fira Code', monospace;
-        }}
-        
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        html {{ scroll-behavior: smooth; }}
-        
-        body {{
-            font-family: var(--font-sans);
-            background: var(--color-bg-primary);
-            color: var(--color-text-primary);
-            min-height: 100vh;
-            line-height: 1.6;
-        }}
-        
-        body::before {{
-            content: '';
-            position: fixed;
-            top: 0; left: 0; right: 0; bottom: 0;
-            background: 
-                radial-gradient(ellipse 80% 50% at 50% -20%, rgba(99, 102, 241, 0.15), transparent),
-                radial-gradient(ellipse 60% 40% at 100% 0%, rgba(139, 92, 246, 0.1), transparent),
-                radial-gradient(ellipse 50% 30% at 0% 100%, rgba(236, 72, 153, 0.08), transparent);
-            pointer-events: none;
-            z-index: -1;
-        }}
-        
-        .container {{ max-width: 1400px; margin: 0 auto; padding: 40px 24px; }}
-        
-        .header {{
-            text-align: center;
-            padding: 60px 40px;
-            margin-bottom: 48px;
-            background: linear-gradient(135deg, rgba(99, 102, 241, 0.1) 0%, rgba(139, 92, 246, 0.05) 100%);
-            border: 1px solid var(--color-border);
-            border-radius: 24px;
-            backdrop-filter: blur(20px);
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .header::before {{
-            content: '';
-            position: absolute;
-            top: 0; left: 0; right: 0;
-            height: 1px;
-            background: linear-gradient(90deg, transparent, rgba(99, 102, 241, 0.5), rgba(139, 92, 246, 0.5), transparent);
-        }}
-        
-        .logo-mark {{
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            width: 72px;
-            height: 72px;
-            background: linear-gradient(135deg, var(--color-accent-blue), var(--color-accent-purple));
-            border-radius: 20px;
-            margin-bottom: 24px;
-            box-shadow: 0 20px 40px rgba(99, 102, 241, 0.3);
-        }}
-        
-        .logo-mark svg {{ width: 40px; height: 40px; fill: white; }}
-        
-        h1 {{
-            font-size: 2.75rem;
-            font-weight: 700;
-            letter-spacing: -0.02em;
-            background: linear-gradient(135deg, #fff 0%, #a5b4fc 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            margin-bottom: 12px;
-        }}
-        
-        .subtitle {{
-            color: var(--color-text-secondary);
-            font-size: 1.1rem;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 16px;
-            flex-wrap: wrap;
-        }}
-        
-        .section {{
-            background: var(--color-bg-card);
-            border: 1px solid var(--color-border);
-            border-radius: 20px;
-            padding: 32px;
-            margin-bottom: 32px;
-            backdrop-filter: blur(10px);
-            transition: all 0.3s ease;
-            animation: fadeIn 0.5s ease forwards;
-        }}
-        
-        .section:hover {{
-            border-color: rgba(99, 102, 241, 0.3);
-            box-shadow: 0 8px 32px rgba(99, 102, 241, 0.1);
-        }}
-        
-        .section h2 {{
-            font-size: 1.5rem;
-            font-weight: 600;
-            margin-bottom: 24px;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            color: var(--color-text-primary);
-        }}
-        
-        .phase-badge {{
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            padding: 6px 14px;
-            border-radius: 10px;
-            font-size: 0.85rem;
-            font-weight: 600;
-            letter-spacing: 0.02em;
-        }}
-        
-        .phase-1 {{ background: linear-gradient(135deg, var(--color-accent-blue), var(--color-accent-purple)); color: white; }}
-        .phase-2 {{ background: linear-gradient(135deg, var(--color-accent-purple), var(--color-accent-pink)); color: white; }}
-        .phase-3 {{ background: linear-gradient(135deg, var(--color-accent-pink), var(--color-accent-orange)); color: white; }}
-        .phase-4 {{ background: linear-gradient(135deg, var(--color-accent-green), #0ea5e9); color: white; }}
-        
-        .table-wrapper {{
-            overflow-x: auto;
-            border-radius: 12px;
-            border: 1px solid var(--color-border);
-            background: rgba(0, 0, 0, 0.2);
-        }}
-        
-        table {{ width: 100%; border-collapse: collapse; font-size: 0.95rem; }}
-        
-        th {{
-            background: rgba(99, 102, 241, 0.15);
-            color: var(--color-text-primary);
-            font-weight: 600;
-            text-align: left;
-            padding: 16px 20px;
-            white-space: nowrap;
-            border-bottom: 1px solid var(--color-border);
-            text-transform: uppercase;
-            font-size: 0.8rem;
-            letter-spacing: 0.05em;
-        }}
-        
-        td {{
-            padding: 14px 20px;
-            border-bottom: 1px solid var(--color-border);
-            color: var(--color-text-secondary);
-        }}
-        
-        tr:last-child td {{ border-bottom: none; }}
-        tr:hover td {{ background: rgba(255, 255, 255, 0.02); }}
-        
-        .success {{ color: var(--color-accent-green); font-weight: 600; }}
-        .error {{ color: var(--color-accent-red); font-weight: 600; }}
-        
-        code {{
-            font-family: var(--font-mono);
-            background: rgba(0, 0, 0, 0.3);
-            padding: 4px 8px;
-            border-radius: 6px;
-            font-size: 0.85rem;
-            color: var(--color-accent-purple);
-        }}
-        
-        .chart-container {{
-            background: rgba(255, 255, 255, 0.02);
-            border: 1px solid var(--color-border);
-            border-radius: 16px;
-            padding: 24px;
-            margin-top: 20px;
-        }}
-        
-        .chart-row {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
-            gap: 24px;
-        }}
-        
-        .footer {{
-            text-align: center;
-            padding: 40px 20px;
-            color: var(--color-text-secondary);
-            font-size: 0.9rem;
-        }}
-        
-        .footer a {{ color: var(--color-accent-blue); text-decoration: none; }}
-        .footer a:hover {{ color: var(--color-accent-purple); }}
-        
-        @keyframes fadeIn {{
-            from {{ opacity: 0; transform: translateY(20px); }}
-            to {{ opacity: 1; transform: translateY(0); }}
-        }}
-        
-        @media (max-width: 768px) {{
-            .container {{ padding: 20px 16px; }}
-            .header {{ padding: 40px 20px; }}
-            h1 {{ font-size: 2rem; }}
-            .section {{ padding: 20px; }}
-            .chart-row {{ grid-template-columns: 1fr; }}
-            th, td {{ padding: 10px 12px; font-size: 0.85rem; }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header class="header">
-            <div class="logo-mark">
-                <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
-                    <path d="M13 3L4 14h7l-2 7 9-11h-7l2-7z" fill="currentColor"/>
-                </svg>
-            </div>
-            <h1>LLM FullTest 对比报告</h1>
-            <p class="subtitle">
-                <span>📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</span>
-                <span>📊 共 {len(results)} 个测试</span>
-            </p>
-        </header>
-        
-        <div class="section">
-            <h2><span class="phase-badge phase-1">Phase 1</span> 性能测试汇总</h2>
-            <div class="table-wrapper">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>测试名称</th>
-                            <th>模型</th>
-                            <th>Avg TTFT (ms)</th>
-                            <th>P99 TTFT (ms)</th>
-                            <th>Avg Latency (ms)</th>
-                            <th>P99 Latency (ms)</th>
-                            <th>Throughput (tok/s)</th>
-                            <th>RPS</th>
-                            <th>成功率</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {phase1_rows}
-                    </tbody>
-                </table>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>⚡ TTFT (首字延迟) 对比</h2>
-            <div class="chart-container">
-                {ttft_chart}
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>⏱️ Latency (总延迟) 对比</h2>
-            <div class="chart-container">
-                {latency_chart}
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>📈 吞吐量对比</h2>
-            <div class="chart-container">
-                {throughput_chart}
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>🎯 综合性能对比</h2>
-            <div class="chart-container">
-                {radar_chart}
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>📦 延迟分布对比</h2>
-            <div class="chart-row">
-                <div class="chart-container">
-                    {ttft_dist_chart}
-                </div>
-                <div class="chart-container">
-                    {latency_dist_chart}
-                </div>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2><span class="phase-badge phase-2">Phase 2</span> Function Call 测试对比</h2>
-            <div class="table-wrapper">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>测试名称</th>
-                            <th>支持状态</th>
-                            <th>函数名</th>
-                            <th>参数</th>
-                            <th>延迟 (ms)</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {fc_rows}
-                    </tbody>
-                </table>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2><span class="phase-badge phase-3">Phase 3</span> 长上下文测试对比</h2>
-            <div class="table-wrapper">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>测试名称</th>
-                            <th>最大支持上下文</th>
-                            <th>平均 TTFT (ms)</th>
-                            <th>平均 Latency (ms)</th>
-                            <th>平均吞吐 (tok/s)</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {lc_rows}
-                    </tbody>
-                </table>
-            </div>
-            <div class="chart-container">
-                {long_context_chart}
-            </div>
-            <div class="chart-container">
-                {long_context_detail_chart}
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2><span class="phase-badge phase-4">Phase 4</span> 会议纪要性能对比</h2>
-            <div class="table-wrapper">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>测试名称</th>
-                            <th>分片数</th>
-                            <th>Prompt Tokens</th>
-                            <th>Completion Tokens</th>
-                            <th>总 Tokens</th>
-                            <th>处理时间 (秒)</th>
-                            <th>Token/s</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {summary_rows}
-                    </tbody>
-                </table>
-            </div>
-            <div class="chart-container">
-                {summary_chart}
-            </div>
-        </div>
-        
-        <footer class="footer">
-            <p>Generated by LLM Benchmark Kit | 
-               <a href="https://github.com/brianxiadong/llm-benchmark-kit">GitHub</a>
-            </p>
-        </footer>
-    </div>
-</body>
-</html>
-"""
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Generate all charts; phases no result ran are left out entirely
+    names = [r.name for r in results]
+    columns = build_columns(results)
+    has_long_context = any(r.lc_results or r.lc_max_supported for r in results)
+    has_summary = bool(columns['summary_total_chunks'].any() or columns['summary_total_tokens'].any())
+    charts = {
+        'ttft_chart': create_ttft_chart(columns, names),
+        'latency_chart': create_latency_chart(columns, names),
+        'throughput_chart': create_throughput_chart(columns, names),
+        'radar_chart': create_radar_chart(columns, names),
+        'dist_chart': create_distribution_chart(results),
+        'long_context_chart': create_long_context_chart(columns, names) if has_long_context else None,
+        'long_context_detail_chart': create_long_context_detail_chart(results) if has_long_context else None,
+        'summary_chart': create_summary_chart(columns, names) if has_summary else None,
+    }
+    divs = {div_id: chart_div(div_id, fig) for div_id, fig in charts.items()}
+    charts_script = render_charts_script(charts)
+    
+    # Stream the rendered template to disk section by section
+    with open_report(output_path) as f:
+        report_template().stream(
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            result_count=len(results),
+            phase1_rows=iter_phase1_rows(results),
+            function_call_rows=iter_function_call_rows(results),
+            long_context_rows=iter_long_context_rows(results),
+            summary_rows=iter_summary_rows(results),
+            divs=divs,
+            charts_script=charts_script,
+            has_long_context=has_long_context,
+            has_summary=has_summary,
+        ).dump(f)
     
     print(f"✅ Report generated: {output_path}")
 
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='LLM FullTest Comparison Report Generator',
@@ -1131,12 +1146,35 @@ Examples:
     parser.add_argument(
         '--output', '-o',
         default='fulltest_comparison.html',
-        help='Output HTML report path (default: fulltest_comparison.html)'
+        help='Output HTML report path, gzip-compressed if it ends in .gz (default: fulltest_comparison.html)'
     )
     parser.add_argument(
         '--pattern', '-p',
         default=None,
-        help='Filter directories by pattern (e.g., "fulltest_")'
+        help='Filter directories by name substring, or glob if it contains * ? [ (e.g., "fulltest_", "fulltest_2024*")'
+    )
+    parser.add_argument(
+        '--sort',
+        choices=sorted(SORT_KEYS),
+        default='name',
+        help='Order results by directory name or modification time (default: name)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Re-parse every result instead of reusing {CACHE_FILENAME} in the input directory'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=positive_int,
+        default=1,
+        help='Worker processes used to parse result directories; 1 parses them in-process (default: 1)'
+    )
+    parser.add_argument(
+        '--max-dist-samples',
+        type=int,
+        default=DEFAULT_MAX_DIST_SAMPLES,
+        help=f'Max TTFT/latency samples kept per result for box plots, 0 keeps all (default: {DEFAULT_MAX_DIST_SAMPLES})'
     )
     
     args = parser.parse_args()
@@ -1144,7 +1182,7 @@ Examples:
     print(f"🔍 Scanning {args.input} for fulltest results...")
     
     # Find all fulltest directories
-    result_dirs = find_fulltest_dirs(args.input, args.pattern)
+    result_dirs = find_fulltest_dirs(args.input, args.pattern, args.sort)
     
     if not result_dirs:
         print("❌ No fulltest results found!")
@@ -1154,12 +1192,9 @@ Examples:
     for d in result_dirs:
         print(f"   - {d.name}")
     
-    # Parse all results
-    results = []
-    for d in result_dirs:
-        result = parse_fulltest_result(d)
-        if result:
-            results.append(result)
+    # Parse all results, skipping unchanged ones recorded in the cache
+    cache_path = None if args.no_cache else Path(args.input) / CACHE_FILENAME
+    results = parse_fulltest_results(result_dirs, cache_path, args.max_dist_samples, args.jobs)
     
     if not results:
         print("❌ Failed to parse any fulltest results!")